@@ -10,6 +10,7 @@ from components.blockchain import Blockchain
 from components.edge_node import EdgeNode
 from components.trust_manager import TrustManager
 from components.placement_controller import PlacementController
+from components.trust_history import TrustHistoryStore
 
 # IMPORT PRODUCT LAYERS
 from product.traffic_monitor import TrafficCamera
@@ -25,8 +26,9 @@ if 'initialized' not in st.session_state:
     blockchain = Blockchain()
     for v in VALIDATORS: blockchain.add_validator(v)
     
-    trust_manager = TrustManager()
-    placement_controller = PlacementController(blockchain)
+    trust_history = TrustHistoryStore()
+    trust_manager = TrustManager(history=trust_history)
+    placement_controller = PlacementController(blockchain, trust_manager)
     violation_detector = ViolationDetector(blockchain, trust_manager)
     evidence_validator = EvidenceValidator(blockchain)
     
@@ -40,11 +42,13 @@ if 'initialized' not in st.session_state:
         node.success_count = int(node.total_tasks * random.uniform(0.85, 0.99))
         node.failure_count = node.total_tasks - node.success_count
         camera_nodes.append(node)
+        trust_history.record(cam_id, node.trust_score)
     
     st.session_state.update({
         'initialized': True,
         'blockchain': blockchain,
         'trust_manager': trust_manager,
+        'trust_history': trust_history,
         'placement_controller': placement_controller,
         'violation_detector': violation_detector,
         'cameras': cameras,
@@ -156,6 +160,25 @@ with col_right:
         st.markdown(f"**{node.node_id}**: <span style='color:{color}'>{node.trust_score:.1f}</span>", unsafe_allow_html=True)
         st.progress(min(int(node.trust_score), 100))
 
+# ==========================================
+# TRUST HISTORY (FROM TIME-SERIES STORE, NOT THE LEDGER)
+# ==========================================
+with st.expander("📈 Trust History"):
+    history = st.session_state.trust_history
+    hist_id = st.selectbox("Camera", history.node_ids(), key="history_camera")
+    resolution = st.radio("Resolution", ["raw", "1m", "1h"], horizontal=True)
+    
+    series = history.query(hist_id, resolution=resolution)
+    values = series["trust"] if resolution == "raw" else series["avg"]
+    if values:
+        chart_df = pd.DataFrame(
+            {"Trust": values},
+            index=pd.to_datetime(series["time"], unit="s")
+        )
+        st.line_chart(chart_df)
+    else:
+        st.info("No trust updates recorded yet.")
+
 # ==========================================
 # 2. AI DEPLOYMENT
 # ==========================================
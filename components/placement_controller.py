@@ -1,11 +1,17 @@
 import time
+from bisect import bisect_left
 
 class PlacementController:
     """
     Implements the Service Placement Logic.
     Process: Filter -> Rank -> Select -> Record
     """
-    def __init__(self, blockchain):
+    def __init__(self, blockchain, trust_manager=None):
+        """
+        Passing a TrustManager turns on the placement cache. The cache only
+        sees trust changes made through TrustManager.update_trust, so call
+        invalidate_cache() after editing node fields or the fleet list directly.
+        """
         self.blockchain = blockchain
         self.trust_threshold = 60.0
         
@@ -15,41 +21,122 @@ class PlacementController:
         self.w2 = 0.3 
         self.w3 = 0.2 
 
-    def request_placement(self, nodes):
+        # Placement Cache (needs a TrustManager to know what changed)
+        # Key: (service_class, threshold, w1, w2, w3)
+        self.trust_manager = trust_manager
+        self._cache = {}
+
+    def score_node(self, node):
+        """Calculates the Placement Score for one node"""
+        # Calculate Reliability (R)
+        reliability = node.success_count / node.total_tasks if node.total_tasks > 0 else 0
+        
+        # Resource Score (Simulated as 1.0 for this demo)
+        resource_score = 1.0 
+        
+        # FINAL FORMULA: Score = w1*T + w2*R + w3*L
+        return (self.w1 * (node.trust_score/100.0)) + \
+               (self.w2 * reliability) + \
+               (self.w3 * resource_score)
+
+    def _build_ranking(self, nodes):
+        """
+        Full Filter + Rank pass over the fleet.
+        Entries are sorted by (-score, position) so ties keep fleet order.
+        """
+        ranking = {"keys": [], "nodes": [], "entries": {}, "positions": {}}
+        for position, node in enumerate(nodes):
+            ranking["positions"][id(node)] = position
+            if node.trust_score >= self.trust_threshold:
+                key = (-self.score_node(node), position)
+                ranking["keys"].append(key)
+                ranking["entries"][position] = key
+        ranking["keys"].sort()
+        ranking["nodes"] = [nodes[position] for _, position in ranking["keys"]]
+        return ranking
+
+    def _patch_ranking(self, ranking, changed_nodes):
+        """Re-scores only the nodes whose trust changed since the last call"""
+        seen = set()
+        for node in changed_nodes:
+            position = ranking["positions"].get(id(node))
+            if position is None or position in seen:
+                continue  # Not part of this fleet / already patched
+            seen.add(position)
+            
+            # Remove the stale entry
+            old_key = ranking["entries"].pop(position, None)
+            if old_key is not None:
+                i = bisect_left(ranking["keys"], old_key)
+                del ranking["keys"][i]
+                del ranking["nodes"][i]
+            
+            # Re-insert if still eligible
+            if node.trust_score >= self.trust_threshold:
+                new_key = (-self.score_node(node), position)
+                i = bisect_left(ranking["keys"], new_key)
+                ranking["keys"].insert(i, new_key)
+                ranking["nodes"].insert(i, node)
+                ranking["entries"][position] = new_key
+
+    def _get_ranking(self, nodes, service_class):
+        """Returns the (possibly cached) ranking for this fleet and key"""
+        if self.trust_manager is None:
+            return self._build_ranking(nodes)
+
+        cache_key = (service_class, self.trust_threshold, self.w1, self.w2, self.w3)
+        entry = self._cache.get(cache_key)
+        current_version = self.trust_manager.version
+        
+        changed = None
+        if entry is not None and entry["fleet"] is nodes and entry["size"] == len(nodes):
+            changed = self.trust_manager.changes_since(entry["version"])
+        
+        if changed is None:
+            # Cold cache, new fleet or change log overflowed: rebuild
+            entry = {"ranking": self._build_ranking(nodes)}
+            self._cache[cache_key] = entry
+        elif changed:
+            self._patch_ranking(entry["ranking"], changed)
+        
+        entry.update(fleet=nodes, size=len(nodes), version=current_version)
+        return entry["ranking"]
+
+    def rank_nodes(self, nodes, service_class="default"):
+        """
+        Returns the eligible nodes as a list of (node, score), best first.
+        With a TrustManager attached the ranking is memoized and only the
+        nodes updated since the previous call are re-scored.
+        
+        The cache recognises the fleet by list identity and length only:
+        replacing or reordering entries in place, or changing trust_score /
+        counters without TrustManager.update_trust, needs invalidate_cache().
+        """
+        ranking = self._get_ranking(nodes, service_class)
+        return [(node, -key[0]) for node, key in zip(ranking["nodes"], ranking["keys"])]
+
+    def invalidate_cache(self):
+        """Drops every cached ranking (e.g. after editing nodes directly)"""
+        self._cache.clear()
+
+    def request_placement(self, nodes, service_class="default"):
         """
         Selects the best node for a high-priority service.
         Returns: (Selected_Node, Success_Message)
         """
-        # 1. SECURITY FILTER: Reject malicious nodes immediately
-        eligible_nodes = [n for n in nodes if n.trust_score >= self.trust_threshold]
+        # 1 + 2. SECURITY FILTER & RANKING: Reject malicious nodes, score the rest
+        ranking = self._get_ranking(nodes, service_class)
         
-        if not eligible_nodes:
+        if not ranking["nodes"]:
             # Log failure to blockchain
             self.blockchain.add_block("PLACEMENT_FAILURE: No trusted nodes available.")
             return None, "CRITICAL FAILURE: All nodes are untrusted (<60)."
 
-        # 2. RANKING ALGORITHM: Calculate Score for each eligible node
-        ranked_nodes = []
-        for node in eligible_nodes:
-            # Calculate Reliability (R)
-            reliability = node.success_count / node.total_tasks if node.total_tasks > 0 else 0
-            
-            # Resource Score (Simulated as 1.0 for this demo)
-            resource_score = 1.0 
-            
-            # FINAL FORMULA: Score = w1*T + w2*R + w3*L
-            score = (self.w1 * (node.trust_score/100.0)) + \
-                    (self.w2 * reliability) + \
-                    (self.w3 * resource_score)
-            
-            ranked_nodes.append((node, score))
-
         # 3. SELECTION: Pick the highest score
-        ranked_nodes.sort(key=lambda x: x[1], reverse=True)
-        best_node, final_score = ranked_nodes[0]
+        best_node, final_score = ranking["nodes"][0], -ranking["keys"][0][0]
 
         # 4. AUDIT: Record the decision on the Blockchain
         txn_data = f"DEPLOY_SUCCESS: Assigned to {best_node.node_id} (Score: {final_score:.2f})"
         self.blockchain.add_block(txn_data)
 
-        return best_node, f"Service Deployed to {best_node.node_id}"
\ No newline at end of file
+        return best_node, f"Service Deployed to {best_node.node_id}"
@@ -0,0 +1,143 @@
+import time
+from array import array
+from bisect import bisect_left, bisect_right
+
+class TrustSeries:
+    """
+    Append-only trust history for ONE node.
+    Raw samples live in fixed-size columnar chunks (time[], value[]),
+    and every append also folds into the 1m / 1h rollups.
+    """
+    CHUNK_SIZE = 1024
+
+    def __init__(self, resolutions):
+        # Raw Columns (split into chunks so appends never copy old data)
+        self.chunks = []          # List of (times, values) array pairs
+        self.chunk_starts = []    # First timestamp of each chunk (for bisect)
+
+        # Rollup Columns per bucket width: start, min, max, sum, count, last
+        self.rollups = {
+            width: {"start": array('d'), "min": array('d'), "max": array('d'),
+                    "sum": array('d'), "count": array('l'), "last": array('d')}
+            for width in resolutions.values()
+        }
+
+    def __len__(self):
+        return sum(len(times) for times, _ in self.chunks)
+
+    def last_time(self):
+        return self.chunks[-1][0][-1] if self.chunks else None
+
+    def append(self, timestamp, value):
+        # 1. Raw Sample
+        if not self.chunks or len(self.chunks[-1][0]) >= self.CHUNK_SIZE:
+            self.chunks.append((array('d'), array('d')))
+            self.chunk_starts.append(timestamp)
+        times, values = self.chunks[-1]
+        times.append(timestamp)
+        values.append(value)
+
+        # 2. Rollups (only the newest bucket ever changes)
+        for width, cols in self.rollups.items():
+            bucket = timestamp - (timestamp % width)
+            if cols["start"] and cols["start"][-1] == bucket:
+                cols["min"][-1] = min(cols["min"][-1], value)
+                cols["max"][-1] = max(cols["max"][-1], value)
+                cols["sum"][-1] += value
+                cols["count"][-1] += 1
+                cols["last"][-1] = value
+            else:
+                cols["start"].append(bucket)
+                cols["min"].append(value)
+                cols["max"].append(value)
+                cols["sum"].append(value)
+                cols["count"].append(1)
+                cols["last"].append(value)
+
+    def raw_range(self, start, end):
+        """Returns (times, values) for start <= t <= end"""
+        out_times, out_values = [], []
+        # bisect_left: an earlier chunk may end on the same timestamp
+        first = max(0, bisect_left(self.chunk_starts, start) - 1)
+        for times, values in self.chunks[first:]:
+            if times[0] > end:
+                break
+            lo = bisect_left(times, start)
+            hi = bisect_right(times, end)
+            out_times.extend(times[lo:hi])
+            out_values.extend(values[lo:hi])
+        return out_times, out_values
+
+    def rollup_range(self, width, start, end):
+        """Returns the rollup buckets overlapping [start, end] as columns"""
+        cols = self.rollups[width]
+        lo = max(0, bisect_right(cols["start"], start) - 1)
+        if lo < len(cols["start"]) and cols["start"][lo] + width <= start:
+            lo += 1  # That bucket ends before the range begins
+        hi = bisect_right(cols["start"], end)
+        return {
+            "time": list(cols["start"][lo:hi]),
+            "min": list(cols["min"][lo:hi]),
+            "max": list(cols["max"][lo:hi]),
+            "avg": [s / c for s, c in zip(cols["sum"][lo:hi], cols["count"][lo:hi])],
+            "last": list(cols["last"][lo:hi]),
+            "count": list(cols["count"][lo:hi]),
+        }
+
+
+class TrustHistoryStore:
+    """
+    Per-node Trust Time-Series Store.
+    Fed by TrustManager.update_trust, so dashboards can chart trust
+    over time without regex-parsing the blockchain ledger.
+    """
+    # Downsampled Rollups (bucket width in seconds)
+    RESOLUTIONS = {"1m": 60, "1h": 3600}
+
+    def __init__(self):
+        self.series = {}   # node_id -> TrustSeries
+
+    def record(self, node_id, trust_score, timestamp=None):
+        """Appends one trust sample. Timestamps never go backwards per node."""
+        if timestamp is None:
+            timestamp = time.time()
+        series = self.series.get(node_id)
+        if series is None:
+            series = self.series[node_id] = TrustSeries(self.RESOLUTIONS)
+        last = series.last_time()
+        if last is not None and timestamp < last:
+            timestamp = last  # Keep the columns sorted (append-only)
+        series.append(float(timestamp), float(trust_score))
+
+    def node_ids(self):
+        return list(self.series.keys())
+
+    def latest(self, node_id):
+        """Returns (timestamp, trust) of the newest sample, or None"""
+        series = self.series.get(node_id)
+        if series is None or not series.chunks:
+            return None
+        times, values = series.chunks[-1]
+        return times[-1], values[-1]
+
+    def query(self, node_id, start=None, end=None, resolution="raw"):
+        """
+        Range query for one node.
+        resolution="raw" -> {"time": [...], "trust": [...]}
+        resolution="1m" / "1h" -> {"time", "min", "max", "avg", "last", "count"}
+        """
+        if resolution != "raw" and resolution not in self.RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+        start = float("-inf") if start is None else start
+        end = float("inf") if end is None else end
+        
+        series = self.series.get(node_id)
+        if resolution == "raw":
+            if series is None:
+                return {"time": [], "trust": []}
+            times, values = series.raw_range(start, end)
+            return {"time": times, "trust": values}
+        
+        if series is None:
+            return {"time": [], "min": [], "max": [], "avg": [], "last": [], "count": []}
+        return series.rollup_range(self.RESOLUTIONS[resolution], start, end)
@@ -5,13 +5,25 @@ class TrustManager:
     Implements the Recency-Weighted Trust Formula.
     Formula: Ti = alpha*S + beta*A - gamma*F + delta*R
     """
-    def __init__(self):
+    # How many trust changes we remember for cache patching
+    CHANGE_LOG_LIMIT = 1024
+
+    def __init__(self, history=None):
         # Hyperparameters (Tuned via Heuristic Analysis)
         self.alpha = 5.0   # Reward for Success
         self.beta = 3.0    # Weight for Recency (Activity)
         self.gamma = 10.0  # Penalty for Failure (Security First)
         self.delta = 2.0   # Reward for Consistency (Reliability)
 
+        # Version Counter (bumped on every trust update)
+        # Lets the PlacementController know which nodes changed.
+        self.version = 0
+        self._change_log = []      # Nodes updated, oldest first
+        self._log_start = 0        # Version of the first log entry
+
+        # Optional TrustHistoryStore (per-node trust time-series)
+        self.history = history
+
     def calculate_recency(self, last_active_time):
         """Calculates the Activity Factor (A)"""
         current_time = time.time()
@@ -20,6 +32,15 @@ class TrustManager:
         # Result is between 0.5 and 1.0
         return max(0.5, 1.0 - (time_diff / 3600))
 
+    def changes_since(self, version):
+        """
+        Returns the nodes updated after the given version.
+        Returns None if the log no longer reaches back that far.
+        """
+        if version < self._log_start:
+            return None
+        return self._change_log[version - self._log_start:]
+
     def update_trust(self, node, is_success):
         """
         Updates the node's trust score.
@@ -47,5 +68,17 @@ class TrustManager:
             
         # Update timestamp
         node.last_activity_time = time.time()
+
+        # 4. Bump Version (so cached placements can be patched)
+        self.version += 1
+        self._change_log.append(node)
+        if len(self._change_log) > self.CHANGE_LOG_LIMIT:
+            dropped = len(self._change_log) - self.CHANGE_LOG_LIMIT
+            del self._change_log[:dropped]
+            self._log_start += dropped
+
+        # 5. Record History (for per-node trust charts)
+        if self.history is not None:
+            self.history.record(node.node_id, node.trust_score, node.last_activity_time)
         
-        return node.trust_score
\ No newline at end of file
+        return node.trust_score
@@ -0,0 +1,51 @@
+import random
+
+from components.blockchain import Blockchain
+from components.edge_node import EdgeNode
+from components.trust_manager import TrustManager
+from components.placement_controller import PlacementController
+
+
+def make_fleet(size, rng):
+    nodes = []
+    for i in range(size):
+        node = EdgeNode(f"Node-{i}", rng.choice([55, 60, 70, 80, 80]))
+        node.total_tasks = rng.randint(0, 5)
+        node.success_count = rng.randint(0, node.total_tasks)
+        nodes.append(node)
+    return nodes
+
+
+def test_cached_ranking_matches_fresh_ranking():
+    rng = random.Random(7)
+    trust_manager = TrustManager()
+    trust_manager.CHANGE_LOG_LIMIT = 20   # Small, so the log overflows often
+    nodes = make_fleet(30, rng)
+
+    cached = PlacementController(Blockchain(), trust_manager)
+    fresh = PlacementController(Blockchain())
+
+    overflowed = False
+    for _ in range(500):
+        # Burst sizes include some larger than CHANGE_LOG_LIMIT
+        for _ in range(rng.choice([0, 1, 3, 50])):
+            trust_manager.update_trust(rng.choice(nodes), rng.random() < 0.6)
+        overflowed = overflowed or trust_manager._log_start > 0
+
+        assert cached.rank_nodes(nodes) == fresh.rank_nodes(nodes)
+        best, _ = cached.request_placement(nodes)
+        expected, _ = fresh.request_placement(nodes)
+        assert best is expected
+
+    assert overflowed
+
+
+def test_invalidate_cache_picks_up_direct_edits():
+    trust_manager = TrustManager()
+    nodes = [EdgeNode("A", 80), EdgeNode("B", 70)]
+    controller = PlacementController(Blockchain(), trust_manager)
+    assert controller.request_placement(nodes)[0] is nodes[0]
+
+    nodes[1].trust_score = 95.0   # Bypasses update_trust
+    controller.invalidate_cache()
+    assert controller.request_placement(nodes)[0] is nodes[1]
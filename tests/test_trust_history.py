@@ -0,0 +1,26 @@
+from components.trust_history import TrustHistoryStore, TrustSeries
+
+
+def test_raw_range_across_chunk_boundary_with_repeated_timestamps(monkeypatch):
+    monkeypatch.setattr(TrustSeries, "CHUNK_SIZE", 4)
+    history = TrustHistoryStore()
+    for i, t in enumerate([1, 2, 3, 5, 5, 5, 6]):
+        history.record("a", float(i), t)
+
+    result = history.query("a", 5, 5)
+    assert result["time"] == [5.0, 5.0, 5.0]
+    assert result["trust"] == [3.0, 4.0, 5.0]
+
+
+def test_late_samples_are_clamped_and_rolled_up():
+    history = TrustHistoryStore()
+    history.record("a", 70.0, 120.0)
+    history.record("a", 60.0, 100.0)   # Late: clamped to t=120
+    history.record("a", 80.0, 200.0)
+
+    assert history.query("a")["time"] == [120.0, 120.0, 200.0]
+    rollup = history.query("a", resolution="1m")
+    assert rollup["time"] == [120.0, 180.0]
+    assert rollup["count"] == [2, 1]
+    assert rollup["avg"] == [65.0, 80.0]
+    assert history.latest("a") == (200.0, 80.0)